@@ -43,11 +43,11 @@ class XMNetDeeplabv3(nn.Module):
         aspp_out = self.aspp(x4)
         pred = self.head(aspp_out)
 
-        pred = F.upsample(pred, size=size, mode='bilinear', align_corners=True)
+        pred = F.interpolate(pred, size=size, mode='bilinear', align_corners=True)
         if self.training and self.with_aux:
             gt_seg = x['gt_semantic_seg']
             aux_pred = self.aux_layer(x3)
-            aux_pred = F.upsample(aux_pred, size=size, mode='bilinear', align_corners=True)
+            aux_pred = F.interpolate(aux_pred, size=size, mode='bilinear', align_corners=True)
             pred = pred, aux_pred
             loss = self.loss(pred, gt_seg)
             return {f"{self.prefix}.loss": loss, "blob_pred": pred[0]}
@@ -2,6 +2,18 @@ import torch.nn as nn
 import torch
 from torch.nn import functional as F
 from up.utils.model.normalize import build_norm_layer
+from up.utils.model.bn_helper import (
+    GroupSyncBatchNorm,
+    TaskBatchNorm2d,
+    SyncTaskBatchNorm2d,
+    TorchSyncTaskBatchNorm2d
+)
+
+
+# norms whose own running stats and affine params define the eval output;
+# task bns read their stats from per-task sub-modules and can not be folded
+_FUSABLE_BN = (nn.modules.batchnorm._BatchNorm, GroupSyncBatchNorm)
+_TASK_BN = (TaskBatchNorm2d, SyncTaskBatchNorm2d, TorchSyncTaskBatchNorm2d)
 
 
 class ConvBnRelu(nn.Module):
@@ -37,6 +49,36 @@ class ConvBnRelu(nn.Module):
             x = self.relu(x)
         return x
 
+    def fuse_model(self):
+        # called by BaseToOnnx._build_model, fold bn into conv for inference;
+        # gn, ln and task bns are kept as they are
+        assert not self.training, 'ConvBnRelu can only be fused in eval mode'
+        if not self.has_bn or not isinstance(self.bn, _FUSABLE_BN) or isinstance(self.bn, _TASK_BN):
+            return
+        if getattr(self.bn, 'running_var', None) is None or not self.bn.affine:
+            return
+        conv, bn = self.conv, self.bn
+        std = (bn.running_var + bn.eps).sqrt()
+        t = bn.weight / std
+        bias = bn.bias - bn.running_mean * t
+        if conv.bias is not None:
+            bias = bias + conv.bias * t
+
+        fused_conv = nn.Conv2d(in_channels=conv.in_channels,
+                               out_channels=conv.out_channels,
+                               kernel_size=conv.kernel_size,
+                               stride=conv.stride,
+                               padding=conv.padding,
+                               dilation=conv.dilation,
+                               groups=conv.groups,
+                               bias=True,
+                               padding_mode=conv.padding_mode).to(conv.weight.device)
+        fused_conv.weight = nn.Parameter((conv.weight * t.reshape(-1, 1, 1, 1)).detach())
+        fused_conv.bias = nn.Parameter(bias.detach())
+        self.conv = fused_conv
+        self.has_bn = False
+        del self.bn
+
 
 class Aux_Module(nn.Module):
     def __init__(self, in_planes, num_classes=19, normalize={'type': 'solo_bn'}):
@@ -87,7 +129,7 @@ class ASPP(nn.Module):
 
     def forward(self, x):
         _, _, h, w = x.size()
-        feat1 = F.upsample(self.conv1(x), size=(h, w), mode='bilinear', align_corners=True)
+        feat1 = F.interpolate(self.conv1(x), size=(h, w), mode='bilinear', align_corners=True)
         feat2 = self.conv2(x)
         feat3 = self.conv3(x)
         feat4 = self.conv4(x)
@@ -87,6 +87,8 @@ class BaseToOnnx(object):
     def _build_model(self):
         if self.model is None:
             self.model = build_model(self.cfg)
+        # fusing conv and bn relies on running stats
+        self.model.eval()
         for module in self.model.modules():
             module.deploy = True
             if hasattr(module, "fuse_model"):
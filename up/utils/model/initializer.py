@@ -1,5 +1,6 @@
 # Standard Library
 import copy
+import functools
 import math
 import warnings
 # Import from third library
@@ -19,84 +20,116 @@ __all__ = [
     'initialize_from_cfg']
 
 
+_INIT_TARGETS = (nn.Conv2d, nn.Linear, nn.ConvTranspose2d)
+
+
+def _iter_modules(module):
+    if isinstance(module, nn.Module):
+        return module.modules()
+    return module
+
+
+def _module_initializer(init_module):
+    """Build an initializer from a function that inits a single module.
+
+    The returned initializer takes either an ``nn.Module``, whose
+    ``modules()`` are all visited, or an iterable of modules, followed by
+    the arguments of ``init_module``. The per-module function is kept as
+    ``init_module`` so that :func:`initialize` can apply it in the same
+    pass that initializes BN.
+    """
+    @functools.wraps(init_module)
+    def initializer(module, *args, **kwargs):
+        for m in _iter_modules(module):
+            init_module(m, *args, **kwargs)
+
+    initializer.init_module = init_module
+    return initializer
+
+
+# The built-in initializers below are written for a single module and wrapped
+# by _module_initializer, so callers pass an nn.Module or an iterable of
+# modules as the first argument, e.g. init_weights_normal(self.fc_cls, 0.01).
+
 @INITIALIZER_REGISTRY.register("constant")
-def init_weights_constant(module, val=0):
-    for m in module.modules():
-        if isinstance(m, nn.Conv2d) or isinstance(m, nn.Linear) or isinstance(
-                m, nn.ConvTranspose2d):
-            nn.init.constant_(m.weight.data, val)
-            nn.init.constant_(m.bias.data, val)
+@_module_initializer
+def init_weights_constant(m, val=0):
+    if isinstance(m, _INIT_TARGETS):
+        nn.init.constant_(m.weight.data, val)
+        nn.init.constant_(m.bias.data, val)
 
 
 @INITIALIZER_REGISTRY.register("normal")
-def init_weights_normal(module, std=0.01):
-    for m in module.modules():
-        if isinstance(m, nn.Conv2d) or isinstance(m, nn.Linear) or isinstance(
-                m, nn.ConvTranspose2d):
-            nn.init.normal_(m.weight.data, std=std)
-            if m.bias is not None:
-                m.bias.data.zero_()
+@_module_initializer
+def init_weights_normal(m, std=0.01):
+    if isinstance(m, _INIT_TARGETS):
+        nn.init.normal_(m.weight.data, std=std)
+        if m.bias is not None:
+            m.bias.data.zero_()
 
 
 @INITIALIZER_REGISTRY.register("xavier")
-def init_weights_xavier(module):
-    for m in module.modules():
-        if isinstance(m, nn.Conv2d) or isinstance(m, nn.Linear) or isinstance(
-                m, nn.ConvTranspose2d):
-            nn.init.xavier_normal_(m.weight.data)
-            if m.bias is not None:
-                m.bias.data.zero_()
+@_module_initializer
+def init_weights_xavier(m):
+    if isinstance(m, _INIT_TARGETS):
+        nn.init.xavier_normal_(m.weight.data)
+        if m.bias is not None:
+            m.bias.data.zero_()
 
 
 @INITIALIZER_REGISTRY.register("msra")
-def init_weights_msra(module):
-    for m in module.modules():
-        if isinstance(m, nn.Conv2d) or isinstance(m, nn.Linear) or isinstance(
-                m, nn.ConvTranspose2d):
-            nn.init.kaiming_normal_(m.weight.data, a=1)
-            if m.bias is not None:
-                m.bias.data.zero_()
+@_module_initializer
+def init_weights_msra(m):
+    if isinstance(m, _INIT_TARGETS):
+        nn.init.kaiming_normal_(m.weight.data, a=1)
+        if m.bias is not None:
+            m.bias.data.zero_()
 
 
 @INITIALIZER_REGISTRY.register("constant_bias")
-def init_bias_constant(module, val=0):
-    for m in module.modules():
-        if isinstance(m, nn.Conv2d) or isinstance(m, nn.Linear) or isinstance(
-                m, nn.ConvTranspose2d):
-            nn.init.constant_(m.bias.data, val)
+@_module_initializer
+def init_bias_constant(m, val=0):
+    if isinstance(m, _INIT_TARGETS):
+        nn.init.constant_(m.bias.data, val)
 
 
 @INITIALIZER_REGISTRY.register("focal")
-def init_bias_focal(module, cls_loss_type, init_prior, num_classes):
+@_module_initializer
+def init_bias_focal(m, cls_loss_type, init_prior, num_classes):
+    if cls_loss_type not in ('sigmoid', 'softmax'):
+        raise NotImplementedError(f'{cls_loss_type} is not supported')
+    if not isinstance(m, (nn.Conv2d, nn.Linear)):
+        return
+
     if cls_loss_type == 'sigmoid':
-        for m in module.modules():
-            if isinstance(m, nn.Conv2d) or isinstance(m, nn.Linear):
-                # to keep the torch random state
-                m.bias.data.normal_(-math.log(1.0 / init_prior - 1.0), init_prior)
-                torch.nn.init.constant_(m.bias, -math.log(1.0 / init_prior - 1.0))
-
-    elif cls_loss_type == 'softmax':
-        for m in module.modules():
-            if isinstance(m, nn.Conv2d) or isinstance(m, nn.Linear):
-                m.bias.data.normal_(0, 0.01)
-                for i in range(0, m.bias.data.shape[0], num_classes):
-                    fg = m.bias.data[i + 1:i + 1 + num_classes - 1]
-                    mu = torch.exp(fg).sum()
-                    m.bias.data[i] = math.log(mu * (1.0 - init_prior) / init_prior)
+        # to keep the torch random state
+        m.bias.data.normal_(-math.log(1.0 / init_prior - 1.0), init_prior)
+        torch.nn.init.constant_(m.bias, -math.log(1.0 / init_prior - 1.0))
     else:
-        raise NotImplementedError(f'{cls_loss_type} is not supported')
+        m.bias.data.normal_(0, 0.01)
+        assert m.bias.data.shape[0] % num_classes == 0
+        bias = m.bias.data.view(-1, num_classes)
+        mu = bias[:, 1:].exp().sum(dim=1)
+        bias[:, 0] = (mu * (1.0 - init_prior) / init_prior).log()
 
 
 def initialize(model, method, **kwargs):
-    # initialize BN
+    init_instance = INITIALIZER_REGISTRY.get(method)
+    # None for initializers registered without _module_initializer
+    init_module = getattr(init_instance, 'init_module', None)
     for m in model.modules():
+        # initialize BN
         if isinstance(m, nn.BatchNorm2d):
             if m.weight is not None:
                 m.weight.data.fill_(1)
             if m.bias is not None:
                 m.bias.data.zero_()
-    init_instance = INITIALIZER_REGISTRY.get(method)
-    init_instance(model, **kwargs)
+            continue
+        if init_module is not None:
+            init_module(m, **kwargs)
+    if init_module is None:
+        # old-style initializers walk the model by themselves
+        init_instance(model, **kwargs)
 
 
 def initialize_from_cfg(model, cfg):